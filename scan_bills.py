@@ -5,6 +5,9 @@ from datetime import datetime
 def main():
     print("🏛️ Starting California Legislative Bill Scan...")
     
+    scan_now = datetime.now()
+    scan_date = scan_now.strftime('%Y-%m-%d')
+    
     # Sample bills for testing
     sample_bills = [
         {
@@ -16,7 +19,7 @@ def main():
             'currentStatus': 'Senate Appropriations',
             'analysisStatus': 'needs-analysis',
             'priority': 'medium',
-            'dateAdded': datetime.now().strftime('%Y-%m-%d'),
+            'dateAdded': scan_date,
             'notes': '',
             'summary': 'Streamlines housing development approval processes for affordable housing projects.'
         },
@@ -29,7 +32,7 @@ def main():
             'currentStatus': 'Senate Appropriations',
             'analysisStatus': 'needs-analysis',
             'priority': 'medium',
-            'dateAdded': datetime.now().strftime('%Y-%m-%d'),
+            'dateAdded': scan_date,
             'notes': '',
             'summary': 'Expands tenant protections and rent stabilization measures statewide.'
         }
@@ -37,6 +40,6 @@ def main():
     
     # Save bills to JSON file
     data = {
-        'last_updated': datetime.now().isoformat(),
+        'last_updated': scan_now.isoformat(),
         'bills': sample_bills
     }